@@ -102,7 +102,7 @@ export class CsBgsPeer extends Peer {
              * while Firefox says, "Attempt to postMessage on disconnected port".
              */
             if (e.message && e.message.indexOf('disconnected port') >= 0) {
-                console.log(`Caught disconnected port "${port.name}"`);
+                console.debug(`Caught disconnected port "${port.name}"`);
                 const [name1, name2] = port.name.split("#");
                 // One name should be that of our peer, one our own.
                 // We can safely attempt to delete both from our mapping.
@@ -164,7 +164,9 @@ export class Peer extends Listenable {
             // In that case, caller already has their answer. So just do nothing.
             return;
         }
-        if (wrapper.rejection_reason) {
+        // Test for presence, not truthiness, so that a rejection with an
+        // empty message is not mistaken for a successful response.
+        if ('rejection_reason' in wrapper) {
             let e = new Error(wrapper.rejection_reason);
             if (this.reconstituteErrors) {
                 e = reconstituteError(e);
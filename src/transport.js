@@ -83,7 +83,10 @@ export class BroadcastChannelTransport {
                 });
                 break;
             case this.eventName.welcome:
-                this.broadcast(this.eventName.welcome, message, {
+                this.broadcast(this.eventName.welcome, {
+                    from: message.from,
+                    birthday: message.birthday,
+                }, {
                     whitelist: [message.to]
                 });
                 break;
@@ -92,11 +95,13 @@ export class BroadcastChannelTransport {
                     blacklist: [this.name]
                 });
                 break;
-            case this.eventName.postWindowMessage:
-                this.broadcast(this.eventName.handleWindowMessage, message, {
-                    whitelist: message.room === this.windowGroupId ? [] : [message.room],
+            case this.eventName.postWindowMessage: {
+                const {room, ...wrapper} = message;
+                this.broadcast(this.eventName.handleWindowMessage, wrapper, {
+                    whitelist: room === this.windowGroupId ? [] : [room],
                 });
                 break;
+            }
             case this.eventName.sendWindowEvent:
                 this.broadcast(this.eventName.genericWindowEvent, message.event || {}, {
                     whitelist: message.room === this.windowGroupId ? [] : [message.room],
@@ -124,6 +129,12 @@ export class SocketTransport {
      * @param socket: a Socket instance (as returned by a call to `io(namespace)`,
      *   using the Socket.IO client library) that has been set up to communicate with
      *   a (remote) server that supports the WindowPeer protocol.
+     *
+     *   Note: the WindowPeer protocol consists mostly of small control messages.
+     *   If the server supports it, you may want to form the socket with
+     *   `io(namespace, {transports: ['websocket']})`, so that it connects by
+     *   WebSocket right away, instead of starting with HTTP long-polling and
+     *   upgrading later.
      */
     constructor(socket) {
         this.socket = socket;
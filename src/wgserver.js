@@ -17,6 +17,12 @@ export class WindowGroupServer extends CsBgsPeer {
             eventNamePrefix = '',
         } = options || {};
         this.eventNamePrefix = eventNamePrefix;
+        const basicNames = ['join', 'depart', 'hello', 'welcome', 'observeDeparture',
+            'handleWindowMessage', 'postWindowMessage', 'genericWindowEvent', 'sendWindowEvent'];
+        this.eventName = {};
+        for (let name of basicNames) {
+            this.eventName[name] = eventNamePrefix + name;
+        }
         const handlerNames = [
             'join',
             'depart',
@@ -25,7 +31,7 @@ export class WindowGroupServer extends CsBgsPeer {
             'sendWindowEvent',
         ];
         for (let name of handlerNames) {
-            this._addBuiltInHandler(eventNamePrefix + name, this[name].bind(this));
+            this._addBuiltInHandler(this.eventName[name], this[name].bind(this));
         }
         this.windowGroupId = 'windowGroup';
     }
@@ -46,7 +52,7 @@ export class WindowGroupServer extends CsBgsPeer {
     }
 
     join({birthday}, meta) {
-        this.broadcastRequest(this.eventNamePrefix + 'hello', {
+        this.broadcastRequest(this.eventName.hello, {
             windowGroupId: this.windowGroupId,
             name: meta.from,
             birthday: birthday,
@@ -56,23 +62,33 @@ export class WindowGroupServer extends CsBgsPeer {
     }
 
     depart(msg, meta) {
+        // The departing window does not need to hear about its own departure.
         this.broadcastRequest(
-            this.eventNamePrefix + 'observeDeparture',
-            {name: meta.from}, {skipReadyChecks: true,}
+            this.eventName.observeDeparture,
+            {name: meta.from}, {
+                skipReadyChecks: true,
+                filter: name => name !== meta.from,
+            }
         );
     }
 
     welcome(msg) {
-        this.makeRequest(msg.to, this.eventNamePrefix + 'welcome', msg);
+        // The recipient only needs to know who is welcoming it.
+        this.makeRequest(msg.to, this.eventName.welcome, {
+            from: msg.from,
+            birthday: msg.birthday,
+        });
     }
 
     postWindowMessage(msg) {
-        this.variableRequest(msg.room, this.eventNamePrefix + 'handleWindowMessage', msg);
+        // The room is only needed for routing, so we do not pass it on.
+        const {room, ...wrapper} = msg;
+        this.variableRequest(room, this.eventName.handleWindowMessage, wrapper);
     }
 
     sendWindowEvent(msg) {
         const includeSelf = (msg.includeSelf !== false); // i.e. accept any boolean, but default to `true` if undefined.
-        this.variableRequest(msg.room, this.eventNamePrefix + 'genericWindowEvent', msg.event, includeSelf);
+        this.variableRequest(msg.room, this.eventName.genericWindowEvent, msg.event, includeSelf);
     }
 
 }